@@ -9,6 +9,8 @@ This example demonstrates:
 3. Providing explainable triage decisions
 """
 
+import os
+
 from glyphh import (
     Encoder, EncoderConfig, Concept, GlyphhModel,
     SimilarityCalculator, LayerConfig, SegmentConfig, Role
@@ -38,9 +40,6 @@ config = EncoderConfig(
 encoder = Encoder(config)
 calculator = SimilarityCalculator()
 
-print("Patient Triage System")
-print("=" * 60)
-
 # Triage categories
 categories = [
     Concept(name="emergent", attributes={"primary_symptom": "chest_pain", "severity": "severe", "duration": "acute", "vital_signs": "abnormal"}),
@@ -48,43 +47,63 @@ categories = [
     Concept(name="non_urgent", attributes={"primary_symptom": "cold_symptoms", "severity": "mild", "duration": "days", "vital_signs": "normal"}),
 ]
 
-print("\nEncoding triage categories...")
-category_glyphs = []
-for cat in categories:
-    glyph = encoder.encode(cat)
-    category_glyphs.append((cat.name, glyph))
-    print(f"  ✓ {cat.name}: {cat.attributes['primary_symptom']}")
-
-# Triage a patient
-patient = Concept(
-    name="patient_001",
-    attributes={"primary_symptom": "chest_pain", "severity": "severe", "duration": "acute", "vital_signs": "abnormal"}
-)
 
-print(f"\nTriaging: {patient.name}")
-patient_glyph = encoder.encode(patient)
-
-best_category = None
-best_score = 0
-for name, cat_glyph in category_glyphs:
-    result = calculator.compute_similarity(patient_glyph, cat_glyph, edge_type="neural_cortex")
-    print(f"  {name}: {result.score:.3f}")
-    if result.score > best_score:
-        best_score = result.score
-        best_category = name
-
-print(f"\n⚠️  TRIAGE RESULT: {best_category.upper()} (confidence: {best_score:.3f})")
-
-# Export
-model = GlyphhModel(
-    name="triage-model",
-    version="1.0.0",
-    encoder_config=config,
-    glyphs=[g for _, g in category_glyphs],
-    metadata={"domain": "healthcare"}
-)
-model.to_file("triage-model.glyphh")
-print("\n✓ Model exported")
+def encode_categories():
+    """Encode the triage categories as (name, glyph) pairs."""
+    print("\nEncoding triage categories...")
+    category_glyphs = []
+    for cat in categories:
+        glyph = encoder.encode(cat)
+        category_glyphs.append((cat.name, glyph))
+        print(f"  ✓ {cat.name}: {cat.attributes['primary_symptom']}")
+    return category_glyphs
 
-import os
-os.remove("triage-model.glyphh")
+
+def triage_patient(patient: Concept, category_glyphs):
+    """Match a patient to the closest triage category."""
+    print(f"\nTriaging: {patient.name}")
+    patient_glyph = encoder.encode(patient)
+
+    best_category = None
+    best_score = 0
+    for name, cat_glyph in category_glyphs:
+        result = calculator.compute_similarity(patient_glyph, cat_glyph, edge_type="neural_cortex")
+        print(f"  {name}: {result.score:.3f}")
+        if result.score > best_score:
+            best_score = result.score
+            best_category = name
+
+    return best_category, best_score
+
+
+def main():
+    print("Patient Triage System")
+    print("=" * 60)
+
+    category_glyphs = encode_categories()
+
+    # Triage a patient
+    patient = Concept(
+        name="patient_001",
+        attributes={"primary_symptom": "chest_pain", "severity": "severe", "duration": "acute", "vital_signs": "abnormal"}
+    )
+    best_category, best_score = triage_patient(patient, category_glyphs)
+
+    print(f"\n⚠️  TRIAGE RESULT: {best_category.upper()} (confidence: {best_score:.3f})")
+
+    # Export
+    model = GlyphhModel(
+        name="triage-model",
+        version="1.0.0",
+        encoder_config=config,
+        glyphs=[g for _, g in category_glyphs],
+        metadata={"domain": "healthcare"}
+    )
+    model.to_file("triage-model.glyphh")
+    print("\n✓ Model exported")
+
+    os.remove("triage-model.glyphh")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ This example demonstrates:
 3. Building audit trails with citations
 """
 
+import os
+
 from glyphh import (
     Encoder, EncoderConfig, Concept, GlyphhModel,
     SimilarityCalculator, LayerConfig, SegmentConfig, Role
@@ -38,9 +40,6 @@ config = EncoderConfig(
 encoder = Encoder(config)
 calculator = SimilarityCalculator()
 
-print("Policy Compliance Checker")
-print("=" * 60)
-
 # Policy rules
 policies = [
     Concept(name="expense_policy", attributes={"policy_type": "expense", "action": "approve", "requirement": "receipt_required", "department": "finance"}),
@@ -48,37 +47,58 @@ policies = [
     Concept(name="data_policy", attributes={"policy_type": "data", "action": "encrypt", "requirement": "pii_protection", "department": "it"}),
 ]
 
-print("\nEncoding policy rules...")
-policy_glyphs = []
-for policy in policies:
-    glyph = encoder.encode(policy)
-    policy_glyphs.append((policy.name, glyph, policy.attributes))
-    print(f"  ✓ {policy.name}: {policy.attributes['requirement']}")
-
-# Check an action
-action = Concept(
-    name="expense_submission",
-    attributes={"policy_type": "expense", "action": "submit", "requirement": "receipt_required", "department": "finance"}
-)
 
-print(f"\nChecking action: {action.name}")
-action_glyph = encoder.encode(action)
-
-for name, policy_glyph, attrs in policy_glyphs:
-    result = calculator.compute_similarity(action_glyph, policy_glyph, edge_type="neural_cortex")
-    if result.score > 0.5:
-        print(f"  ✓ Matches {name}: {attrs['requirement']} (score: {result.score:.3f})")
-
-# Export
-model = GlyphhModel(
-    name="policy-compliance",
-    version="1.0.0",
-    encoder_config=config,
-    glyphs=[g for _, g, _ in policy_glyphs],
-    metadata={"domain": "compliance"}
-)
-model.to_file("policy-compliance.glyphh")
-print("\n✓ Model exported")
+def encode_policies():
+    """Encode the policy rules as (name, glyph, attributes) triples."""
+    print("\nEncoding policy rules...")
+    policy_glyphs = []
+    for policy in policies:
+        glyph = encoder.encode(policy)
+        policy_glyphs.append((policy.name, glyph, policy.attributes))
+        print(f"  ✓ {policy.name}: {policy.attributes['requirement']}")
+    return policy_glyphs
 
-import os
-os.remove("policy-compliance.glyphh")
+
+def check_compliance(action: Concept, policy_glyphs, threshold: float = 0.5):
+    """Return the policies an action matches above the threshold."""
+    print(f"\nChecking action: {action.name}")
+    action_glyph = encoder.encode(action)
+
+    matches = []
+    for name, policy_glyph, attrs in policy_glyphs:
+        result = calculator.compute_similarity(action_glyph, policy_glyph, edge_type="neural_cortex")
+        if result.score > threshold:
+            print(f"  ✓ Matches {name}: {attrs['requirement']} (score: {result.score:.3f})")
+            matches.append((name, result.score))
+    return matches
+
+
+def main():
+    print("Policy Compliance Checker")
+    print("=" * 60)
+
+    policy_glyphs = encode_policies()
+
+    # Check an action
+    action = Concept(
+        name="expense_submission",
+        attributes={"policy_type": "expense", "action": "submit", "requirement": "receipt_required", "department": "finance"}
+    )
+    check_compliance(action, policy_glyphs)
+
+    # Export
+    model = GlyphhModel(
+        name="policy-compliance",
+        version="1.0.0",
+        encoder_config=config,
+        glyphs=[g for _, g, _ in policy_glyphs],
+        metadata={"domain": "compliance"}
+    )
+    model.to_file("policy-compliance.glyphh")
+    print("\n✓ Model exported")
+
+    os.remove("policy-compliance.glyphh")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,9 @@ This example demonstrates:
 3. Finding similar products
 """
 
+import heapq
+from operator import itemgetter
+
 from glyphh import (
     Encoder, EncoderConfig, Concept, GlyphhModel,
     SimilarityCalculator, LayerConfig, SegmentConfig, Role
@@ -66,7 +69,7 @@ for name, glyph, attrs in glyphs:
     result = calculator.compute_similarity(query_glyph, glyph, edge_type="neural_cortex")
     results.append((name, result.score, attrs))
 
-for name, score, attrs in sorted(results, key=lambda x: -x[1])[:3]:
+for name, score, attrs in heapq.nlargest(3, results, key=itemgetter(1)):
     print(f"  {name}: {score:.3f} ({attrs['category']}, {attrs['color']})")
 
 # Export
@@ -20,6 +20,8 @@ Use Cases:
 - Internal request routing
 """
 
+from functools import lru_cache
+
 from glyphh import (
     Encoder, EncoderConfig, Concept, GlyphhModel,
     SimilarityCalculator, LayerConfig, SegmentConfig, Role,
@@ -279,27 +281,48 @@ intent_encoder.add_pattern(IntentPattern(
 # Ticket Routing Function
 # =============================================================================
 
-def route_ticket(subject: str, body: str, confidence_threshold: float = 0.7):
+@lru_cache(maxsize=4096)
+def _encode_ticket_text(ticket_text: str):
+    """Encode ticket text for similarity matching, reusing glyphs for repeat tickets."""
+    ticket_concept = Concept(
+        name="incoming_ticket",
+        attributes={
+            "category": "unknown",
+            "team": "unknown",
+            "priority": "medium",
+            "keywords": ticket_text,
+            "description": ticket_text
+        }
+    )
+    return encoder.encode(ticket_concept)
+
+def route_ticket(subject: str, body: str, confidence_threshold: float = 0.7,
+                 verbose: bool = True):
     """
     Route a support ticket to the appropriate team.
     
     Uses intent matching first, then falls back to similarity search
     against historical tickets and category definitions.
+
+    Pass verbose=False when calling from an API handler to skip the
+    console report and only return the routing decision.
     """
     ticket_text = f"{subject} {body}"
     
-    print(f"\n{'='*60}")
-    print(f"ROUTING TICKET")
-    print(f"Subject: {subject}")
-    print('='*60)
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"ROUTING TICKET")
+        print(f"Subject: {subject}")
+        print('='*60)
     
     # Try intent matching first
     intent_match = intent_encoder.match_intent(ticket_text)
     
     if intent_match and intent_match.confidence > confidence_threshold:
         template = intent_match.structured_query
-        print(f"\n✓ Intent Match: {intent_match.intent_type}")
-        print(f"  Confidence: {intent_match.confidence:.2f}")
+        if verbose:
+            print(f"\n✓ Intent Match: {intent_match.intent_type}")
+            print(f"  Confidence: {intent_match.confidence:.2f}")
         
         return {
             "team": template.get("team", "Triage Queue"),
@@ -312,20 +335,10 @@ def route_ticket(subject: str, body: str, confidence_threshold: float = 0.7):
         }
     
     # Fall back to similarity search
-    print("\n? No strong intent match, using similarity search...")
+    if verbose:
+        print("\n? No strong intent match, using similarity search...")
     
-    # Create a ticket concept for similarity matching
-    ticket_concept = Concept(
-        name="incoming_ticket",
-        attributes={
-            "category": "unknown",
-            "team": "unknown",
-            "priority": "medium",
-            "keywords": ticket_text,
-            "description": ticket_text
-        }
-    )
-    ticket_glyph = encoder.encode(ticket_concept)
+    ticket_glyph = _encode_ticket_text(ticket_text)
     
     # Find most similar category
     best_match = None
@@ -341,8 +354,9 @@ def route_ticket(subject: str, body: str, confidence_threshold: float = 0.7):
     
     if best_match and best_score >= confidence_threshold:
         attrs = best_match.attributes
-        print(f"\n✓ Category Match: {best_match.name}")
-        print(f"  Confidence: {best_score:.2f}")
+        if verbose:
+            print(f"\n✓ Category Match: {best_match.name}")
+            print(f"  Confidence: {best_score:.2f}")
         
         return {
             "team": attrs.get("team"),
@@ -355,7 +369,8 @@ def route_ticket(subject: str, body: str, confidence_threshold: float = 0.7):
         }
     
     # Low confidence - escalate to human
-    print("\n⚠️  Low confidence - escalating to human triage")
+    if verbose:
+        print("\n⚠️  Low confidence - escalating to human triage")
     return {
         "team": "Triage Queue",
         "category": "unknown",
@@ -17,6 +17,8 @@ Output:
 - AUTH_REQUIRED: connect required provider/app before executing
 """
 
+from functools import lru_cache
+
 from glyphh import (
     Encoder, EncoderConfig, Concept, GlyphhModel,
     SimilarityCalculator, LayerConfig, SegmentConfig, Role
@@ -249,6 +251,11 @@ def _missing_slots(tool_id: str, provided: dict) -> list[str]:
 def _requires_auth(tool_id: str) -> bool:
     return bool(TOOL_CATALOG[tool_id]["requires_auth"])
 
+@lru_cache(maxsize=1024)
+def _encode_request(name: str, attributes: tuple):
+    # Retries (ASK -> slot filled -> re-route) send the same request again
+    return encoder.encode(Concept(name=name, attributes=dict(attributes)))
+
 def _build_ask(missing: list[str]) -> dict:
     # Keep it simple: minimal clarifying question
     if not missing:
@@ -275,7 +282,7 @@ def route_tool(request: Concept, provided_slots: dict, context: dict):
     print(f"TOOL ROUTING: {request.name}")
     print('='*60)
 
-    req_glyph = encoder.encode(request)
+    req_glyph = _encode_request(request.name, tuple(request.attributes.items()))
 
     # Similarity to exemplars
     scores = []
@@ -284,7 +291,7 @@ def route_tool(request: Concept, provided_slots: dict, context: dict):
         scores.append(result.score)
 
     # Pick best exemplar / tool
-    best_idx = max(range(len(scores)), key=lambda i: scores[i])
+    best_idx = scores.index(max(scores))
     best_score = scores[best_idx]
     best_exemplar = routing_exemplars[best_idx]
     tool_id = best_exemplar.attributes["tool_id"]